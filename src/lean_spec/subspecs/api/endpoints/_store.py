@@ -0,0 +1,32 @@
+"""Store access shared by the endpoint handlers."""
+
+from __future__ import annotations
+
+from aiohttp import web
+
+from lean_spec.subspecs.forkchoice import Store
+
+
+def get_store(request: web.Request) -> Store:
+    """
+    Resolve the current store for a request.
+
+    Every handler that reads the store calls this first.
+    A missing store answers 503 before any handler work is done.
+
+    Args:
+        request: Incoming request. Its application holds the store getter.
+
+    Returns:
+        The current forkchoice store.
+
+    Raises:
+        web.HTTPServiceUnavailable: If no getter is configured or it returns no store.
+    """
+    store_getter = request.app.get("store_getter")
+    store = store_getter() if store_getter else None
+
+    if store is None:
+        raise web.HTTPServiceUnavailable(reason="Store not initialized")
+
+    return store
@@ -6,6 +6,8 @@ import json
 
 from aiohttp import web
 
+from ._store import get_store
+
 
 async def handle_justified(request: web.Request) -> web.Response:
     """
@@ -21,11 +23,7 @@ async def handle_justified(request: web.Request) -> web.Response:
         200 OK: Checkpoint returned successfully.
         503 Service Unavailable: Store not initialized.
     """
-    store_getter = request.app.get("store_getter")
-    store = store_getter() if store_getter else None
-
-    if store is None:
-        raise web.HTTPServiceUnavailable(reason="Store not initialized")
+    store = get_store(request)
 
     justified = store.latest_justified
 
@@ -2,9 +2,258 @@
 
 from __future__ import annotations
 
-import json
+import operator
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Final
 
-from aiohttp import web
+import cbor2
+import orjson
+from aiohttp import hdrs, web
+
+from lean_spec.subspecs.containers import Block
+from lean_spec.subspecs.forkchoice import Store
+from lean_spec.types import Bytes32
+
+from ._store import get_store
+
+NODES_FORMAT_SOA: Final = "soa"
+"""Query value selecting the column-oriented node layout."""
+
+MEDIA_TYPE_JSON: Final = "application/json"
+"""Default media type of the response."""
+
+MEDIA_TYPE_CBOR: Final = "application/cbor"
+"""Accepted media type selecting the CBOR encoding."""
+
+_HEADERS: Final = {
+    MEDIA_TYPE_JSON: {hdrs.CONTENT_TYPE: MEDIA_TYPE_JSON, hdrs.VARY: hdrs.ACCEPT},
+    MEDIA_TYPE_CBOR: {hdrs.CONTENT_TYPE: MEDIA_TYPE_CBOR, hdrs.VARY: hdrs.ACCEPT},
+}
+"""
+Response headers for each media type, shared by every fork choice response.
+
+Passing the header directly skips content type resolution per response.
+aiohttp copies it into each response, so the shared mappings are never mutated.
+The encoding depends on the Accept header, so caches are told to key on it.
+"""
+
+
+@dataclass(slots=True)
+class ResponseCache:
+    """
+    Last serialized responses and the store fields they were built from.
+
+    A live node replaces its store on every interval tick and gossip message.
+    Most replacements leave the fields this endpoint reads untouched.
+    Store copies are shallow, so untouched fields keep their identity.
+    Those identities therefore version the response.
+
+    Handlers run on a single event loop, so no lock is needed.
+    """
+
+    inputs: tuple[object, ...] = ()
+    """Store fields the cached bodies were built from."""
+
+    bodies: dict[tuple[str, str | None], bytes] = field(default_factory=dict)
+    """Serialized responses for those fields, keyed by media type and node format."""
+
+
+CACHE_KEY: Final = web.AppKey("fork_choice_cache", ResponseCache)
+"""Application key of the response cache, one per server."""
+
+
+def _response_inputs(store: Store) -> tuple[object, ...]:
+    """Collect every store field the response is built from."""
+    return (
+        store.blocks,
+        store.states,
+        store.latest_known_aggregated_payloads,
+        store.head,
+        store.safe_target,
+        store.latest_justified,
+        store.latest_finalized,
+    )
+
+
+def _negotiate_media_type(accept: str) -> str:
+    """
+    Pick the response media type from an Accept header.
+
+    Each offered type takes the quality of the most specific range that matches it.
+    CBOR is chosen only when the client ranks it strictly above JSON.
+    Otherwise JSON is returned, even when the client accepts neither.
+
+    Args:
+        accept: Raw Accept header value, a comma-separated list of media ranges.
+
+    Returns:
+        The media type to encode the response with.
+    """
+    # Per offered type: specificity of the best matching range, and its quality.
+    #
+    # Specificity is 2 for an exact match, 1 for "type/*", 0 for "*/*".
+    # A type that no range matches keeps quality 0, meaning not acceptable.
+    best = {MEDIA_TYPE_JSON: (-1, 0.0), MEDIA_TYPE_CBOR: (-1, 0.0)}
+
+    for media_range in accept.split(","):
+        media, *params = media_range.split(";")
+        media = media.strip().lower()
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        for offered, (specificity, _) in best.items():
+            if media == offered:
+                match = 2
+            elif media == offered.split("/")[0] + "/*":
+                match = 1
+            elif media == "*/*":
+                match = 0
+            else:
+                continue
+            if match > specificity:
+                best[offered] = (match, quality)
+
+    if best[MEDIA_TYPE_CBOR][1] > best[MEDIA_TYPE_JSON][1]:
+        return MEDIA_TYPE_CBOR
+    return MEDIA_TYPE_JSON
+
+
+def _hex_root(root: Bytes32) -> str:
+    """
+    Format a root as a 0x-prefixed hex string.
+
+    Calls the raw bytes method directly to skip the copy made by the SSZ override.
+    Builds the result in a single f-string instead of a concatenation.
+    """
+    return f"0x{bytes.hex(root)}"
+
+
+def _as_is[T](value: T) -> T:
+    """Return a value unchanged, for fields an encoder handles natively."""
+    return value
+
+
+def _unfinalized_blocks(store: Store) -> Iterator[tuple[Bytes32, Block]]:
+    """Yield each block at or above the finalized slot, with its root, in insertion order."""
+    # Bind per-iteration lookups to locals once, outside the loop.
+    finalized_slot = store.latest_finalized.slot
+
+    for root, block in store.blocks.items():
+        if block.slot >= finalized_slot:
+            yield root, block
+
+
+def _node_objects(
+    store: Store,
+    weights: dict[Bytes32, int],
+    format_root: Callable[[Bytes32], object],
+    to_int: Callable[[int], object],
+) -> list[dict[str, object]]:
+    """
+    Build the tree as one object per block.
+
+    Args:
+        store: Store snapshot to read blocks from.
+        weights: Attestation weight per block root.
+        format_root: Converts a root into the encoding's representation.
+        to_int: Converts a slot or index into the encoding's integer type.
+    """
+    weight_of = weights.get
+    return [
+        {
+            "root": format_root(root),
+            "slot": to_int(block.slot),
+            "parent_root": format_root(block.parent_root),
+            "proposer_index": to_int(block.proposer_index),
+            "weight": weight_of(root, 0),
+        }
+        for root, block in _unfinalized_blocks(store)
+    ]
+
+
+def _node_columns(
+    store: Store,
+    weights: dict[Bytes32, int],
+    format_root: Callable[[Bytes32], object],
+    to_int: Callable[[int], object],
+) -> dict[str, list[object]]:
+    """
+    Build the tree as parallel arrays, one per field.
+
+    Allocates five lists instead of one dict per block.
+    Homogeneous arrays encode in a tight loop in either encoder.
+
+    Args:
+        store: Store snapshot to read blocks from.
+        weights: Attestation weight per block root.
+        format_root: Converts a root into the encoding's representation.
+        to_int: Converts a slot or index into the encoding's integer type.
+    """
+    roots: list[object] = []
+    slots: list[object] = []
+    parent_roots: list[object] = []
+    proposer_indices: list[object] = []
+    node_weights: list[object] = []
+
+    weight_of = weights.get
+    for root, block in _unfinalized_blocks(store):
+        roots.append(format_root(root))
+        slots.append(to_int(block.slot))
+        parent_roots.append(format_root(block.parent_root))
+        proposer_indices.append(to_int(block.proposer_index))
+        node_weights.append(weight_of(root, 0))
+    return {
+        "root": roots,
+        "slot": slots,
+        "parent_root": parent_roots,
+        "proposer_index": proposer_indices,
+        "weight": node_weights,
+    }
+
+
+def _response(
+    store: Store,
+    weights: dict[Bytes32, int],
+    nodes_format: str | None,
+    validator_count: int,
+    format_root: Callable[[Bytes32], object],
+    to_int: Callable[[int], object],
+) -> dict[str, object]:
+    """
+    Build the response object shared by every encoding.
+
+    Args:
+        store: Store snapshot the response describes.
+        weights: Attestation weight per block root.
+        nodes_format: Requested node layout, or None for one object per block.
+        validator_count: Number of validators in the head state.
+        format_root: Converts a root into the encoding's representation.
+        to_int: Converts a slot or index into the encoding's integer type.
+    """
+    build_nodes = _node_columns if nodes_format == NODES_FORMAT_SOA else _node_objects
+
+    return {
+        "nodes": build_nodes(store, weights, format_root, to_int),
+        "head": format_root(store.head),
+        "justified": {
+            "slot": to_int(store.latest_justified.slot),
+            "root": format_root(store.latest_justified.root),
+        },
+        "finalized": {
+            "slot": to_int(store.latest_finalized.slot),
+            "root": format_root(store.latest_finalized.root),
+        },
+        "safe_target": format_root(store.safe_target),
+        "validator_count": validator_count,
+    }
 
 
 async def handle(request: web.Request) -> web.Response:
@@ -14,9 +263,19 @@ async def handle(request: web.Request) -> web.Response:
     Returns the fork choice tree snapshot: blocks with weights, head,
     checkpoints, safe target, and validator count.
 
+    Query Parameters:
+        - format (optional): "soa" returns nodes as parallel arrays instead of
+          an array of objects.
+
+    Request Headers:
+        - Accept (optional): ranking "application/cbor" above "application/json"
+          returns the same object encoded as CBOR, with roots as raw 32-byte
+          strings instead of hex. Quality values are honored; JSON is the default.
+
     Response: JSON object with fields:
         - nodes (array): Blocks in the tree, each with root, slot, parent_root,
-          proposer_index, and weight.
+          proposer_index, and weight. With format=soa, an object mapping each
+          of those fields to an array of values, one entry per block.
         - head (string): Current head block root as 0x-prefixed hex.
         - justified (object): Latest justified checkpoint (slot, root).
         - finalized (object): Latest finalized checkpoint (slot, root).
@@ -25,50 +284,54 @@ async def handle(request: web.Request) -> web.Response:
 
     Status Codes:
         200 OK: Fork choice tree returned successfully.
+        400 Bad Request: Unsupported format requested.
         503 Service Unavailable: Store not initialized.
     """
-    store_getter = request.app.get("store_getter")
-    store = store_getter() if store_getter else None
+    store = get_store(request)
 
-    if store is None:
-        raise web.HTTPServiceUnavailable(reason="Store not initialized")
+    nodes_format = request.query.get("format")
+    if nodes_format not in (None, NODES_FORMAT_SOA):
+        raise web.HTTPBadRequest(reason="Unsupported format")
 
-    finalized_slot = store.latest_finalized.slot
-    weights = store.compute_block_weights()
+    accept = request.headers.get(hdrs.ACCEPT)
+    media_type = MEDIA_TYPE_JSON if accept is None else _negotiate_media_type(accept)
+    key = (media_type, nodes_format)
 
-    nodes = []
-    for root, block in store.blocks.items():
-        if block.slot < finalized_slot:
-            continue
-        nodes.append(
-            {
-                "root": "0x" + root.hex(),
-                "slot": int(block.slot),
-                "parent_root": "0x" + block.parent_root.hex(),
-                "proposer_index": int(block.proposer_index),
-                "weight": weights.get(root, 0),
-            }
-        )
+    # A handler mounted outside the API server gets a cache scoped to this request.
+    cache = request.app.get(CACHE_KEY)
+    if cache is None:
+        cache = ResponseCache()
+
+    # While the fields read below keep their identity, the response is byte-identical.
+    #
+    # Serve the cached body and skip weight computation entirely.
+    inputs = _response_inputs(store)
+    if len(cache.inputs) != len(inputs) or not all(map(operator.is_, cache.inputs, inputs)):
+        cache.inputs = inputs
+        cache.bodies = {}
+    elif (cached := cache.bodies.get(key)) is not None:
+        return web.Response(body=cached, headers=_HEADERS[media_type])
+
+    weights = store.compute_block_weights()
 
     head_state = store.states.get(store.head)
     validator_count = len(head_state.validators) if head_state is not None else 0
 
-    response = {
-        "nodes": nodes,
-        "head": "0x" + store.head.hex(),
-        "justified": {
-            "slot": int(store.latest_justified.slot),
-            "root": "0x" + store.latest_justified.root.hex(),
-        },
-        "finalized": {
-            "slot": int(store.latest_finalized.slot),
-            "root": "0x" + store.latest_finalized.root.hex(),
-        },
-        "safe_target": "0x" + store.safe_target.hex(),
-        "validator_count": validator_count,
-    }
+    if media_type == MEDIA_TYPE_CBOR:
+        # CBOR carries bytes natively, so roots stay raw 32-byte strings.
+        #
+        # cbor2 range-checks integers with comparisons the strict SSZ types reject.
+        response = _response(store, weights, nodes_format, validator_count, _as_is, int)
+        body = cbor2.dumps(response)
+    else:
+        # orjson encodes the SSZ int subclasses natively, so they pass through.
+        #
+        # It serializes straight to bytes, skipping the intermediate str.
+        response = _response(store, weights, nodes_format, validator_count, _hex_root, _as_is)
+        body = orjson.dumps(response)
+    cache.bodies[key] = body
 
-    return web.Response(
-        body=json.dumps(response),
-        content_type="application/json",
-    )
+    # A single pre-sized bytes body keeps the response non-streaming.
+    #
+    # aiohttp then derives Content-Length itself and sends headers and body together.
+    return web.Response(body=body, headers=_HEADERS[media_type])
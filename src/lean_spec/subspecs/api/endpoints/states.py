@@ -7,6 +7,8 @@ import logging
 
 from aiohttp import web
 
+from ._store import get_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,11 +25,7 @@ async def handle_finalized(request: web.Request) -> web.Response:
         404 Not Found: Finalized state not available in store.
         503 Service Unavailable: Store not initialized.
     """
-    store_getter = request.app.get("store_getter")
-    store = store_getter() if store_getter else None
-
-    if store is None:
-        raise web.HTTPServiceUnavailable(reason="Store not initialized")
+    store = get_store(request)
 
     finalized = store.latest_finalized
 
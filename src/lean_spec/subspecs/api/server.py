@@ -16,14 +16,11 @@ from aiohttp import web
 
 from lean_spec.subspecs.forkchoice import Store
 
+from .endpoints import fork_choice
 from .routes import ROUTES
 
 logger = logging.getLogger(__name__)
 
-
-_routes = [web.get(path, handler) for path, handler in ROUTES.items()]
-"""aiohttp route definitions generated from ROUTES."""
-
 # The following classes are implementation details.
 # Other implementations may structure their code differently.
 
@@ -77,6 +74,18 @@ class ApiServer:
         """Get the current Store instance."""
         return self.store_getter() if self.store_getter else None
 
+    @property
+    def port(self) -> int:
+        """
+        Port the server is listening on.
+
+        Resolves an OS-assigned port (configured as 0) once the server has started.
+        Falls back to the configured port before that.
+        """
+        if self._runner is None or not self._runner.addresses:
+            return self.config.port
+        return self._runner.addresses[0][1]
+
     async def start(self) -> None:
         """Start the API server in the background."""
         if not self.config.enabled:
@@ -88,8 +97,11 @@ class ApiServer:
         # Store the store_getter in app for handlers that need store access
         app["store_getter"] = self.store_getter
 
+        # Each server caches its own fork choice responses
+        app[fork_choice.CACHE_KEY] = fork_choice.ResponseCache()
+
         # Add all routes
-        app.add_routes(_routes)
+        app.add_routes(ROUTES)
 
         self._runner = web.AppRunner(app)
         await self._runner.setup()
@@ -97,24 +109,19 @@ class ApiServer:
         self._site = web.TCPSite(self._runner, self.config.host, self.config.port)
         await self._site.start()
 
-        logger.info("API server listening on %s:%d", self.config.host, self.config.port)
+        logger.info("API server listening on %s:%d", self.config.host, self.port)
 
     async def run(self) -> None:
         """
         Run the API server until shutdown.
 
-        Blocks until stop() is called.
+        Blocks until the server is closed.
         """
         await self.start()
 
         while self._runner is not None:
             await asyncio.sleep(1)
 
-    def stop(self) -> None:
-        """Request graceful shutdown (fire-and-forget). Prefer aclose() in async code."""
-        if self._runner is not None:
-            asyncio.create_task(self._async_stop())
-
     async def aclose(self) -> None:
         """Gracefully stop the server. Await this in async code for clean shutdown."""
         await self._async_stop()
@@ -519,11 +519,15 @@ class Node:
         # Each service exits its run loop when stopped.
         self.chain_service.stop()
         self.network_service.stop()
-        if self.api_server is not None:
-            self.api_server.stop()
         if self.validator_service is not None:
             self.validator_service.stop()
 
+        # The API server shuts down by awaiting its runner cleanup.
+        #
+        # Its run loop exits once cleanup completes.
+        if self.api_server is not None:
+            await self.api_server.aclose()
+
     def stop(self) -> None:
         """
         Request graceful shutdown.
@@ -4,6 +4,88 @@ Shared pytest fixtures for API server tests.
 Core fixtures inherited from parent conftest files.
 """
 
-# All fixtures are inherited from tests/lean_spec/conftest.py via pytest discovery.
-# This file exists to establish the conftest hierarchy and can be extended
-# with API-specific fixtures as needed.
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from lean_spec.subspecs.containers.checkpoint import Checkpoint
+from lean_spec.subspecs.containers.slot import Slot
+from lean_spec.subspecs.containers.validator import ValidatorIndex, ValidatorIndices
+from lean_spec.subspecs.forkchoice import Store
+from lean_spec.subspecs.ssz.hash import hash_tree_root
+from lean_spec.subspecs.xmss.aggregation import AggregatedSignatureProof
+from lean_spec.types.byte_arrays import ByteListMiB
+from tests.lean_spec.helpers import make_attestation_data_simple, make_bytes32, make_signed_block
+
+# Core fixtures are inherited from tests/lean_spec/conftest.py via pytest discovery.
+# API-specific fixtures live below.
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """
+    HTTP client shared by every test in a module.
+
+    Reuses one connection pool instead of building a new one per test.
+    Tests using it must run on the module-scoped event loop.
+    """
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+def _make_empty_proof(participants: list[ValidatorIndex]) -> AggregatedSignatureProof:
+    """Create an aggregated proof with empty proof data for testing."""
+    return AggregatedSignatureProof(
+        participants=ValidatorIndices(data=participants).to_aggregation_bits(),
+        proof_data=ByteListMiB(data=b""),
+    )
+
+
+@pytest.fixture
+def voted_store(base_store: Store) -> Store:
+    """
+    Store with a two-block chain above genesis and one vote on each block.
+
+    Validator 0 votes for block 2 and validator 1 votes for block 1.
+    Block 1 therefore weighs 2, block 2 weighs 1, and block 2 is the head.
+    """
+    genesis_root = base_store.head
+
+    block1 = make_signed_block(
+        slot=Slot(1),
+        proposer_index=ValidatorIndex(0),
+        parent_root=genesis_root,
+        state_root=make_bytes32(10),
+    )
+    block1_root = hash_tree_root(block1.block)
+
+    block2 = make_signed_block(
+        slot=Slot(2),
+        proposer_index=ValidatorIndex(1),
+        parent_root=block1_root,
+        state_root=make_bytes32(20),
+    )
+    block2_root = hash_tree_root(block2.block)
+
+    genesis_state = base_store.states[genesis_root]
+    source = Checkpoint(root=genesis_root, slot=Slot(0))
+
+    return base_store.model_copy(
+        update={
+            "blocks": base_store.blocks | {block1_root: block1.block, block2_root: block2.block},
+            "states": base_store.states | {block2_root: genesis_state},
+            "head": block2_root,
+            "latest_known_aggregated_payloads": {
+                make_attestation_data_simple(Slot(2), block2_root, block2_root, source): {
+                    _make_empty_proof([ValidatorIndex(0)])
+                },
+                make_attestation_data_simple(Slot(1), block1_root, block1_root, source): {
+                    _make_empty_proof([ValidatorIndex(1)])
+                },
+            },
+        }
+    )
@@ -11,10 +11,14 @@ These tests cover leanSpec-specific implementation details:
 
 from __future__ import annotations
 
+import cbor2
 import httpx
+import pytest
 
 from lean_spec.subspecs.api import ApiServer, ApiServerConfig
+from lean_spec.subspecs.chain.clock import Interval
 from lean_spec.subspecs.forkchoice import Store
+from lean_spec.types import Bytes32
 
 
 class TestApiServerConfiguration:
@@ -60,108 +64,369 @@ class TestApiServerStoreIntegration:
         assert server.store is base_store
 
 
+@pytest.mark.asyncio(loop_scope="module")
+class TestApiServerPortBinding:
+    """Tests for resolving the listening port."""
+
+    async def test_port_zero_resolves_to_os_assigned_port(self, client: httpx.AsyncClient) -> None:
+        """Configuring port 0 binds a free port and reports it once started."""
+        server = ApiServer(config=ApiServerConfig(host="127.0.0.1", port=0))
+
+        assert server.port == 0
+
+        await server.start()
+
+        try:
+            assert server.port != 0
+
+            response = await client.get(f"http://127.0.0.1:{server.port}/lean/v0/health")
+
+            assert response.status_code == 200
+
+        finally:
+            await server.aclose()
+
+
+@pytest.mark.asyncio(loop_scope="module")
 class TestFinalizedStateEndpoint:
     """Tests for the /lean/v0/states/finalized endpoint error handling."""
 
-    async def test_returns_503_when_store_not_initialized(self) -> None:
+    async def test_returns_503_when_store_not_initialized(self, client: httpx.AsyncClient) -> None:
         """Endpoint returns 503 Service Unavailable when store is not set."""
-        config = ApiServerConfig(port=15054)
+        config = ApiServerConfig(port=0)
         server = ApiServer(config=config)
 
         await server.start()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get("http://127.0.0.1:15054/lean/v0/states/finalized")
+            response = await client.get(f"http://127.0.0.1:{server.port}/lean/v0/states/finalized")
 
-                assert response.status_code == 503
+            assert response.status_code == 503
 
         finally:
             await server.aclose()
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestJustifiedCheckpointEndpoint:
     """Tests for the /lean/v0/checkpoints/justified endpoint error handling."""
 
-    async def test_returns_503_when_store_not_initialized(self) -> None:
+    async def test_returns_503_when_store_not_initialized(self, client: httpx.AsyncClient) -> None:
         """Endpoint returns 503 Service Unavailable when store is not set."""
-        config = ApiServerConfig(port=15057)
+        config = ApiServerConfig(port=0)
         server = ApiServer(config=config)
 
         await server.start()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get("http://127.0.0.1:15057/lean/v0/checkpoints/justified")
+            response = await client.get(
+                f"http://127.0.0.1:{server.port}/lean/v0/checkpoints/justified"
+            )
 
-                assert response.status_code == 503
+            assert response.status_code == 503
 
         finally:
             await server.aclose()
 
 
+@pytest.mark.asyncio(loop_scope="module")
 class TestForkChoiceEndpoint:
     """Tests for the /lean/v0/fork_choice endpoint."""
 
-    async def test_returns_503_when_store_not_initialized(self) -> None:
+    async def test_returns_503_when_store_not_initialized(self, client: httpx.AsyncClient) -> None:
         """Endpoint returns 503 Service Unavailable when store is not set."""
-        config = ApiServerConfig(port=15058)
+        config = ApiServerConfig(port=0)
         server = ApiServer(config=config)
 
         await server.start()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get("http://127.0.0.1:15058/lean/v0/fork_choice")
+            response = await client.get(f"http://127.0.0.1:{server.port}/lean/v0/fork_choice")
 
-                assert response.status_code == 503
+            assert response.status_code == 503
 
         finally:
             await server.aclose()
 
-    async def test_returns_200_with_initialized_store(self, base_store: Store) -> None:
+    async def test_returns_200_with_initialized_store(
+        self, base_store: Store, client: httpx.AsyncClient
+    ) -> None:
         """Endpoint returns 200 with fork choice tree when store is initialized."""
-        config = ApiServerConfig(port=15059)
+        config = ApiServerConfig(port=0)
         server = ApiServer(config=config, store_getter=lambda: base_store)
 
         await server.start()
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get("http://127.0.0.1:15059/lean/v0/fork_choice")
+            response = await client.get(f"http://127.0.0.1:{server.port}/lean/v0/fork_choice")
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/json"
+            assert response.headers["content-length"] == str(len(response.content))
+            assert "transfer-encoding" not in response.headers
+
+            data = response.json()
+
+            assert set(data.keys()) == {
+                "nodes",
+                "head",
+                "justified",
+                "finalized",
+                "safe_target",
+                "validator_count",
+            }
+
+            head_root = "0x" + base_store.head.hex()
+
+            assert data["head"] == head_root
+            assert data["validator_count"] == 3
+            assert data["justified"] == {
+                "slot": int(base_store.latest_justified.slot),
+                "root": "0x" + base_store.latest_justified.root.hex(),
+            }
+            assert data["finalized"] == {
+                "slot": int(base_store.latest_finalized.slot),
+                "root": "0x" + base_store.latest_finalized.root.hex(),
+            }
+
+            assert len(data["nodes"]) == 1
+            node = data["nodes"][0]
+            assert node["root"] == head_root
+            assert node["slot"] == 0
+            assert node["weight"] == 0
 
-                assert response.status_code == 200
-                assert response.headers["content-type"] == "application/json"
+        finally:
+            await server.aclose()
 
-                data = response.json()
+    async def test_response_tracks_store_updates(
+        self, base_store: Store, client: httpx.AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Repeated requests reuse the response until a field it reads changes."""
+        compute_block_weights = Store.compute_block_weights
+        computed_for: list[Store] = []
 
-                assert set(data.keys()) == {
-                    "nodes",
-                    "head",
-                    "justified",
-                    "finalized",
-                    "safe_target",
-                    "validator_count",
-                }
+        def counting_compute_block_weights(store: Store) -> dict[Bytes32, int]:
+            computed_for.append(store)
+            return compute_block_weights(store)
 
-                head_root = "0x" + base_store.head.hex()
+        monkeypatch.setattr(Store, "compute_block_weights", counting_compute_block_weights)
 
-                assert data["head"] == head_root
-                assert data["validator_count"] == 3
-                assert data["justified"] == {
-                    "slot": int(base_store.latest_justified.slot),
-                    "root": "0x" + base_store.latest_justified.root.hex(),
-                }
-                assert data["finalized"] == {
-                    "slot": int(base_store.latest_finalized.slot),
-                    "root": "0x" + base_store.latest_finalized.root.hex(),
+        current = base_store
+        config = ApiServerConfig(port=0)
+        server = ApiServer(config=config, store_getter=lambda: current)
+
+        await server.start()
+
+        try:
+            url = f"http://127.0.0.1:{server.port}/lean/v0/fork_choice"
+
+            first = await client.get(url)
+            second = await client.get(url)
+
+            assert computed_for == [base_store]
+            assert second.content == first.content
+            assert first.headers["content-type"] == "application/json"
+            assert second.headers["content-type"] == "application/json"
+            assert second.headers["content-length"] == str(len(second.content))
+
+            # An interval tick only advances time, so the cached body still applies.
+            current = base_store.model_copy(update={"time": base_store.time + Interval(1)})
+
+            ticked = await client.get(url)
+
+            assert computed_for == [base_store]
+            assert ticked.content == first.content
+
+            safe_target = Bytes32(b"\x01" * 32)
+            current = current.model_copy(update={"safe_target": safe_target})
+
+            updated = await client.get(url)
+
+            assert computed_for == [base_store, current]
+            assert updated.json() == first.json() | {"safe_target": "0x" + safe_target.hex()}
+
+        finally:
+            await server.aclose()
+
+    async def test_soa_format_returns_parallel_arrays(
+        self, base_store: Store, client: httpx.AsyncClient
+    ) -> None:
+        """The soa format lays out nodes as one array per field."""
+        config = ApiServerConfig(port=0)
+        server = ApiServer(config=config, store_getter=lambda: base_store)
+
+        await server.start()
+
+        try:
+            url = f"http://127.0.0.1:{server.port}/lean/v0/fork_choice"
+
+            default = (await client.get(url)).json()
+            response = await client.get(url, params={"format": "soa"})
+
+            assert response.status_code == 200
+
+            head_root = "0x" + base_store.head.hex()
+            genesis = base_store.blocks[base_store.head]
+
+            assert response.json() == default | {
+                "nodes": {
+                    "root": [head_root],
+                    "slot": [0],
+                    "parent_root": ["0x" + genesis.parent_root.hex()],
+                    "proposer_index": [int(genesis.proposer_index)],
+                    "weight": [0],
                 }
+            }
+
+        finally:
+            await server.aclose()
+
+    async def test_cbor_accept_returns_raw_roots(
+        self, voted_store: Store, client: httpx.AsyncClient
+    ) -> None:
+        """Accepting CBOR yields the same fields with roots as raw bytes and plain integers."""
+        config = ApiServerConfig(port=0)
+        server = ApiServer(config=config, store_getter=lambda: voted_store)
+
+        await server.start()
+
+        try:
+            url = f"http://127.0.0.1:{server.port}/lean/v0/fork_choice"
+            headers = {"Accept": "application/cbor"}
+
+            response = await client.get(url, headers=headers)
+            cached = await client.get(url, headers=headers)
+
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/cbor"
+            assert response.headers["vary"] == "Accept"
+            assert cached.headers["content-type"] == "application/cbor"
+            assert cached.content == response.content
+
+            genesis_root, block1_root, block2_root = voted_store.blocks.keys()
+            genesis = voted_store.blocks[genesis_root]
+
+            assert cbor2.loads(response.content) == {
+                "nodes": [
+                    {
+                        "root": bytes(genesis_root),
+                        "slot": 0,
+                        "parent_root": bytes(genesis.parent_root),
+                        "proposer_index": int(genesis.proposer_index),
+                        "weight": 0,
+                    },
+                    {
+                        "root": bytes(block1_root),
+                        "slot": 1,
+                        "parent_root": bytes(genesis_root),
+                        "proposer_index": 0,
+                        "weight": 2,
+                    },
+                    {
+                        "root": bytes(block2_root),
+                        "slot": 2,
+                        "parent_root": bytes(block1_root),
+                        "proposer_index": 1,
+                        "weight": 1,
+                    },
+                ],
+                "head": bytes(block2_root),
+                "justified": {
+                    "slot": int(voted_store.latest_justified.slot),
+                    "root": bytes(voted_store.latest_justified.root),
+                },
+                "finalized": {
+                    "slot": int(voted_store.latest_finalized.slot),
+                    "root": bytes(voted_store.latest_finalized.root),
+                },
+                "safe_target": bytes(voted_store.safe_target),
+                "validator_count": 3,
+            }
+
+        finally:
+            await server.aclose()
+
+    async def test_cbor_soa_format_returns_parallel_arrays(
+        self, voted_store: Store, client: httpx.AsyncClient
+    ) -> None:
+        """CBOR supports the soa layout, with roots as raw bytes and plain integers."""
+        config = ApiServerConfig(port=0)
+        server = ApiServer(config=config, store_getter=lambda: voted_store)
+
+        await server.start()
+
+        try:
+            response = await client.get(
+                f"http://127.0.0.1:{server.port}/lean/v0/fork_choice",
+                params={"format": "soa"},
+                headers={"Accept": "application/cbor"},
+            )
+
+            assert response.status_code == 200
+
+            genesis_root, block1_root, block2_root = voted_store.blocks.keys()
+            genesis = voted_store.blocks[genesis_root]
+
+            assert cbor2.loads(response.content)["nodes"] == {
+                "root": [bytes(genesis_root), bytes(block1_root), bytes(block2_root)],
+                "slot": [0, 1, 2],
+                "parent_root": [
+                    bytes(genesis.parent_root),
+                    bytes(genesis_root),
+                    bytes(block1_root),
+                ],
+                "proposer_index": [int(genesis.proposer_index), 0, 1],
+                "weight": [0, 2, 1],
+            }
+
+        finally:
+            await server.aclose()
+
+    async def test_accept_quality_values_select_encoding(
+        self, base_store: Store, client: httpx.AsyncClient
+    ) -> None:
+        """CBOR is served only when the client ranks it above JSON."""
+        config = ApiServerConfig(port=0)
+        server = ApiServer(config=config, store_getter=lambda: base_store)
+
+        await server.start()
+
+        try:
+            url = f"http://127.0.0.1:{server.port}/lean/v0/fork_choice"
+            cases = {
+                "application/json, application/cbor;q=0": "application/json",
+                "application/cbor;q=0.5, application/json": "application/json",
+                "application/json;q=0.5, application/cbor": "application/cbor",
+                "application/cbor, */*;q=0.1": "application/cbor",
+                "*/*": "application/json",
+                "text/html": "application/json",
+            }
+
+            for accept, expected in cases.items():
+                response = await client.get(url, headers={"Accept": accept})
+
+                assert response.status_code == 200
+                assert response.headers["content-type"] == expected
+                assert response.headers["vary"] == "Accept"
+
+        finally:
+            await server.aclose()
+
+    async def test_returns_400_for_unknown_format(
+        self, base_store: Store, client: httpx.AsyncClient
+    ) -> None:
+        """Endpoint rejects node formats it does not support."""
+        config = ApiServerConfig(port=0)
+        server = ApiServer(config=config, store_getter=lambda: base_store)
+
+        await server.start()
+
+        try:
+            response = await client.get(
+                f"http://127.0.0.1:{server.port}/lean/v0/fork_choice", params={"format": "xml"}
+            )
 
-                assert len(data["nodes"]) == 1
-                node = data["nodes"][0]
-                assert node["root"] == head_root
-                assert node["slot"] == 0
-                assert node["weight"] == 0
+            assert response.status_code == 400
 
         finally:
             await server.aclose()
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from lean_spec.subspecs.containers.attestation import AttestationData
 from lean_spec.subspecs.containers.checkpoint import Checkpoint
 from lean_spec.subspecs.containers.slot import Slot
 from lean_spec.subspecs.containers.validator import ValidatorIndex, ValidatorIndices
@@ -10,7 +9,7 @@ from lean_spec.subspecs.forkchoice import Store
 from lean_spec.subspecs.ssz.hash import hash_tree_root
 from lean_spec.subspecs.xmss.aggregation import AggregatedSignatureProof
 from lean_spec.types.byte_arrays import ByteListMiB
-from tests.lean_spec.helpers import make_bytes32, make_signed_block
+from tests.lean_spec.helpers import make_attestation_data_simple, make_bytes32, make_signed_block
 
 
 def _make_empty_proof(participants: list[ValidatorIndex]) -> AggregatedSignatureProof:
@@ -46,21 +45,13 @@ def test_linear_chain_weight_accumulates_upward(base_store: Store) -> None:
     )
     block2_root = hash_tree_root(block2.block)
 
-    new_blocks = dict(base_store.blocks)
-    new_blocks[block1_root] = block1.block
-    new_blocks[block2_root] = block2.block
+    new_blocks = base_store.blocks | {block1_root: block1.block, block2_root: block2.block}
 
-    new_states = dict(base_store.states)
     genesis_state = base_store.states[genesis_root]
-    new_states[block1_root] = genesis_state
-    new_states[block2_root] = genesis_state
+    new_states = base_store.states | {block1_root: genesis_state, block2_root: genesis_state}
 
-    att_data = AttestationData(
-        slot=Slot(2),
-        head=Checkpoint(root=block2_root, slot=Slot(2)),
-        target=Checkpoint(root=block2_root, slot=Slot(2)),
-        source=Checkpoint(root=genesis_root, slot=Slot(0)),
-    )
+    source = Checkpoint(root=genesis_root, slot=Slot(0))
+    att_data = make_attestation_data_simple(Slot(2), block2_root, block2_root, source)
     proof = _make_empty_proof([ValidatorIndex(0)])
     aggregated_payloads = {
         att_data: {proof},
@@ -95,18 +86,12 @@ def test_multiple_attestations_accumulate(base_store: Store) -> None:
     )
     block1_root = hash_tree_root(block1.block)
 
-    new_blocks = dict(base_store.blocks)
-    new_blocks[block1_root] = block1.block
+    new_blocks = base_store.blocks | {block1_root: block1.block}
 
-    new_states = dict(base_store.states)
-    new_states[block1_root] = base_store.states[genesis_root]
+    new_states = base_store.states | {block1_root: base_store.states[genesis_root]}
 
-    att_data = AttestationData(
-        slot=Slot(1),
-        head=Checkpoint(root=block1_root, slot=Slot(1)),
-        target=Checkpoint(root=block1_root, slot=Slot(1)),
-        source=Checkpoint(root=genesis_root, slot=Slot(0)),
-    )
+    source = Checkpoint(root=genesis_root, slot=Slot(0))
+    att_data = make_attestation_data_simple(Slot(1), block1_root, block1_root, source)
 
     proof = _make_empty_proof([ValidatorIndex(0), ValidatorIndex(1)])
     aggregated_payloads = {
@@ -126,3 +111,80 @@ def test_multiple_attestations_accumulate(base_store: Store) -> None:
 
     # Both validators contribute weight to block1
     assert weights == {block1_root: 2}
+
+
+def test_votes_on_different_heads_share_common_ancestors(base_store: Store) -> None:
+    """Each vote adds weight to its head and to every ancestor above finalized."""
+    genesis_root = base_store.head
+
+    block1 = make_signed_block(
+        slot=Slot(1),
+        proposer_index=ValidatorIndex(0),
+        parent_root=genesis_root,
+        state_root=make_bytes32(10),
+    )
+    block1_root = hash_tree_root(block1.block)
+
+    block2 = make_signed_block(
+        slot=Slot(2),
+        proposer_index=ValidatorIndex(1),
+        parent_root=block1_root,
+        state_root=make_bytes32(20),
+    )
+    block2_root = hash_tree_root(block2.block)
+
+    source = Checkpoint(root=genesis_root, slot=Slot(0))
+
+    store = base_store.model_copy(
+        update={
+            "blocks": base_store.blocks | {block1_root: block1.block, block2_root: block2.block},
+            "latest_known_aggregated_payloads": {
+                make_attestation_data_simple(Slot(1), block1_root, block1_root, source): {
+                    _make_empty_proof([ValidatorIndex(0)])
+                },
+                make_attestation_data_simple(Slot(2), block2_root, block2_root, source): {
+                    _make_empty_proof([ValidatorIndex(1)])
+                },
+            },
+        }
+    )
+
+    # Validator 0 votes for block1, validator 1 for its child block2.
+    # Block1 is an ancestor of both heads, so it carries both votes.
+    assert store.compute_block_weights() == {block1_root: 2, block2_root: 1}
+
+
+def test_weight_walk_stops_at_unknown_parent(base_store: Store) -> None:
+    """A vote only weighs the blocks reachable through known parents."""
+    genesis_root = base_store.head
+
+    block1 = make_signed_block(
+        slot=Slot(1),
+        proposer_index=ValidatorIndex(0),
+        parent_root=genesis_root,
+        state_root=make_bytes32(10),
+    )
+    block1_root = hash_tree_root(block1.block)
+
+    block2 = make_signed_block(
+        slot=Slot(2),
+        proposer_index=ValidatorIndex(1),
+        parent_root=block1_root,
+        state_root=make_bytes32(20),
+    )
+    block2_root = hash_tree_root(block2.block)
+
+    source = Checkpoint(root=genesis_root, slot=Slot(0))
+    att_data = make_attestation_data_simple(Slot(2), block2_root, block2_root, source)
+
+    # Block2 is known but its parent block1 is not.
+    store = base_store.model_copy(
+        update={
+            "blocks": base_store.blocks | {block2_root: block2.block},
+            "latest_known_aggregated_payloads": {
+                att_data: {_make_empty_proof([ValidatorIndex(0)])}
+            },
+        }
+    )
+
+    assert store.compute_block_weights() == {block2_root: 1}
@@ -199,8 +199,7 @@ class TestProposalHeadTiming:
         genesis_hash = hash_tree_root(genesis_block)
 
         # Use immutable update to add block
-        new_blocks = dict(sample_store.blocks)
-        new_blocks[genesis_hash] = genesis_block
+        new_blocks = sample_store.blocks | {genesis_hash: genesis_block}
         sample_store = sample_store.model_copy(update={"blocks": new_blocks, "head": genesis_hash})
 
         # Get proposal head for slot 0